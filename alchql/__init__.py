@@ -1,4 +1,6 @@
-import pkg_resources
+from importlib.metadata import version
+
+from packaging.version import Version
 
 from .fields import SQLAlchemyConnectionField
 from .types import SQLAlchemyObjectType
@@ -21,5 +23,5 @@ __all__ = [
     "get_query",
 ]
 
-if pkg_resources.get_distribution("SQLAlchemy").parsed_version.release < (1, 4):
+if Version(version("SQLAlchemy")).release < (1, 4):
     raise Exception("Use SQLAlchemy version > 1.4")
@@ -1,10 +1,25 @@
-from contextlib import asynccontextmanager
-from inspect import isawaitable
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Type, Union
+from collections import OrderedDict
+from inspect import (
+    Parameter,
+    isawaitable,
+    isclass,
+    iscoroutinefunction,
+    signature,
+)
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Type, Union
 
 from graphene import Context
-from graphql import ExecutionResult, graphql
+from graphql import (
+    DocumentNode,
+    ExecutionResult,
+    GraphQLError,
+    execute,
+    parse,
+    validate,
+    validate_schema,
+)
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import sessionmaker
 from starlette.background import BackgroundTasks
 from starlette.requests import HTTPConnection, Request
 from starlette.responses import HTMLResponse, JSONResponse, Response
@@ -15,9 +30,41 @@ from starlette_graphene3 import (
 
 from .extensions import Extension, ExtensionManager
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 DEFAULT_GET = object()
 
 
+if orjson is not None:
+
+    class GraphQLResponse(JSONResponse):
+        def render(self, content: Any) -> bytes:
+            try:
+                return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+            except orjson.JSONEncodeError:
+                # e.g. ints beyond 64 bits returned by BigInt
+                return super().render(content)
+
+else:
+    GraphQLResponse = JSONResponse
+
+
+def _accepts_kwarg(func: Callable, name: str) -> bool:
+    try:
+        parameters = signature(func).parameters.values()
+    except (TypeError, ValueError):
+        return True
+
+    return any(
+        p.kind == Parameter.VAR_KEYWORD
+        or (p.name == name and p.kind != Parameter.POSITIONAL_ONLY)
+        for p in parameters
+    )
+
+
 class SessionQLApp(GraphQLApp):
     def __init__(
         self,
@@ -28,9 +75,15 @@ class SessionQLApp(GraphQLApp):
         ] = DEFAULT_GET,
         extensions: List[Type[Extension]] = (),
         *args,
+        session_factory: Optional[Callable[[], AsyncSession]] = None,
+        document_cache_size: int = 1024,
         **kwargs,
     ):
         self.engine = engine
+        # Connections are pooled by the engine, sessions are cheap wrappers over it
+        self.session_factory = session_factory or sessionmaker(
+            engine, class_=AsyncSession
+        )
         if on_get == DEFAULT_GET:
             on_get = lambda request: HTMLResponse(
                 f"""
@@ -55,16 +108,26 @@ class SessionQLApp(GraphQLApp):
             )
 
         self.extensions = extensions or ()
+        self.document_cache_size = document_cache_size
+        self._document_cache: OrderedDict[str, DocumentNode] = OrderedDict()
         super().__init__(context_value=context_value, on_get=on_get, *args, **kwargs)
+        self._context_accepts_background = callable(
+            self.context_value
+        ) and _accepts_kwarg(self.context_value, "background")
+        # a class with ``async def __call__`` still builds its instance synchronously
+        self._context_is_async = iscoroutinefunction(self.context_value) or (
+            not isclass(self.context_value)
+            and iscoroutinefunction(getattr(self.context_value, "__call__", None))
+        )
 
     async def _handle_http_request(self, request: Request) -> JSONResponse:
         try:
             operations = await _get_operation_from_request(request)
         except ValueError as e:
-            return JSONResponse({"errors": [e.args[0]]}, status_code=400)
+            return GraphQLResponse({"errors": [e.args[0]]}, status_code=400)
 
         if isinstance(operations, list):
-            return JSONResponse(
+            return GraphQLResponse(
                 {"errors": ["This server does not support batching"]}, status_code=400
             )
         else:
@@ -74,21 +137,28 @@ class SessionQLApp(GraphQLApp):
         variable_values = operation.get("variables")
         operation_name = operation.get("operationName")
 
-        async with self._get_context_value(request) as context_value:
+        context_value, session = await self._open_context(request)
+        try:
             middleware = self.middleware or ()
             extension_manager = ExtensionManager(self.extensions, context=context_value)
 
             with extension_manager.request():
-                result: ExecutionResult = await graphql(
-                    self.schema.graphql_schema,
-                    source=query,
-                    context_value=context_value,
-                    root_value=self.root_value,
-                    middleware=(*middleware, *extension_manager.extensions),
-                    variable_values=variable_values,
-                    operation_name=operation_name,
-                    execution_context_class=self.execution_context_class,
-                )
+                document, errors = self._get_document(query)
+                if errors:
+                    result = ExecutionResult(data=None, errors=errors)
+                else:
+                    result = execute(
+                        self.schema.graphql_schema,
+                        document,
+                        context_value=context_value,
+                        root_value=self.root_value,
+                        middleware=(*middleware, *extension_manager.extensions),
+                        variable_values=variable_values,
+                        operation_name=operation_name,
+                        execution_context_class=self.execution_context_class,
+                    )
+                    if isawaitable(result):
+                        result = await result
 
             extension_results = extension_manager.format()
             if extension_results:
@@ -96,42 +166,85 @@ class SessionQLApp(GraphQLApp):
 
             background = getattr(context_value, "background", None)
 
+            await session.commit()
+        finally:
+            # closing without a commit rolls the transaction back
+            await session.close()
+
         response: Dict[str, Any] = {"data": result.data}
         if result.errors:
+            errors = []
             for error in result.errors:
                 if error.original_error:
                     self.logger.error(
                         "An exception occurred in resolvers",
                         exc_info=error.original_error,
                     )
-            response["errors"] = [
-                self.error_formatter(error) for error in result.errors
-            ]
+                errors.append(self.error_formatter(error))
+            response["errors"] = errors
         if result.extensions:
             response["extensions"] = result.extensions
 
-        return JSONResponse(
+        return GraphQLResponse(
             response,
             status_code=200,
             background=background,
         )
 
-    @asynccontextmanager
-    async def _get_context_value(self, request: HTTPConnection) -> Context:
-        async with AsyncSession(self.engine) as session:
-            async with session.begin():
-                if callable(self.context_value):
+    def _get_document(
+        self, query: str
+    ) -> Tuple[Optional[DocumentNode], Optional[List[GraphQLError]]]:
+        document = self._document_cache.get(query)
+        if document is not None:
+            self._document_cache.move_to_end(query)
+            return document, None
+
+        schema = self.schema.graphql_schema
+        errors = validate_schema(schema)
+        if errors:
+            return None, errors
+
+        try:
+            document = parse(query)
+        except GraphQLError as error:
+            return None, [error]
+
+        errors = validate(schema, document)
+        if errors:
+            return None, errors
+
+        if self.document_cache_size > 0:
+            self._document_cache[query] = document
+            if len(self._document_cache) > self.document_cache_size:
+                self._document_cache.popitem(last=False)
+
+        return document, None
+
+    async def _open_context(
+        self, request: HTTPConnection
+    ) -> Tuple[Context, AsyncSession]:
+        session = self.session_factory()
+        try:
+            await session.begin()
+            if callable(self.context_value):
+                if self._context_accepts_background:
                     context = self.context_value(
                         request=request,
                         background=BackgroundTasks(),
                         session=session,
                     )
-                    if isawaitable(context):
-                        context = await context
-                    yield context
                 else:
-                    yield self.context_value or Context(
-                        request=request,
-                        background=BackgroundTasks(),
-                        session=session,
-                    )
+                    context = self.context_value(request=request, session=session)
+                if self._context_is_async:
+                    context = await context
+            else:
+                context = self.context_value or Context(
+                    request=request,
+                    background=BackgroundTasks(),
+                    session=session,
+                )
+        except BaseException:
+            await session.close()
+            raise
+
+        return context, session
@@ -35,6 +35,16 @@ def set_object_type(root, info: ResolveInfo):
 
 
 def get_batch_resolver(relationship_prop: RelationshipProperty, single=False):
+    # Kept on the property itself so it is released together with the mapper.
+    # Not in ``.info``: that dict is user supplied and may be shared.
+    resolvers = relationship_prop.__dict__.setdefault("_alchql_batch_resolvers", {})
+    resolver = resolvers.get(single)
+    if resolver is None:
+        resolver = resolvers[single] = _build_batch_resolver(relationship_prop, single)
+    return resolver
+
+
+def _build_batch_resolver(relationship_prop: RelationshipProperty, single: bool):
     async def resolve(root, info: ResolveInfo, **args):
         key = (
             relationship_prop.parent.entity,
@@ -36,12 +36,26 @@ def convert_sqlalchemy_relationship(
     orm_field_name: str,
     **field_kwargs,
 ) -> Dynamic:
+    # TODO Allow override of connection_field_factory and resolver via ORMField
+    if connection_field_factory is None:
+        connection_field_factory = BatchSQLAlchemyConnectionField.from_relationship
+
     def dynamic_type():
         """:rtype: Field|None"""
+        registry = obj_type._meta.registry
+        field = registry.get_relationship_field(obj_type, orm_field_name)
+        if field is not None:
+            return field
+
+        field = _convert_relationship(registry)
+        if field is not None:
+            registry.register_relationship_field(obj_type, orm_field_name, field)
+
+        return field
+
+    def _convert_relationship(registry: Registry):
         direction = relationship_prop.direction
-        child_type = obj_type._meta.registry.get_type_for_model(
-            relationship_prop.mapper.entity
-        )
+        child_type = registry.get_type_for_model(relationship_prop.mapper.entity)
 
         if not child_type:
             return None
@@ -50,6 +64,7 @@ def convert_sqlalchemy_relationship(
             return _convert_o2o_or_m2o_relationship(
                 relationship_prop,
                 obj_type,
+                child_type,
                 orm_field_name,
                 **field_kwargs,
             )
@@ -58,6 +73,7 @@ def convert_sqlalchemy_relationship(
             return _convert_o2m_or_m2m_relationship(
                 relationship_prop,
                 obj_type,
+                child_type,
                 connection_field_factory,
                 **field_kwargs,
             )
@@ -100,6 +116,7 @@ def convert_sqlalchemy_fk_reverse(
 def _convert_o2o_or_m2o_relationship(
     relationship_prop: RelationshipProperty,
     obj_type: Type["SQLAlchemyObjectType"],
+    child_type: Type["SQLAlchemyObjectType"],
     orm_field_name: str,
     **field_kwargs,
 ) -> Field:
@@ -108,10 +125,6 @@ def _convert_o2o_or_m2o_relationship(
     Return an object field.
     """
 
-    child_type = obj_type._meta.registry.get_type_for_model(
-        relationship_prop.mapper.entity
-    )
-
     resolver = get_custom_resolver(obj_type, orm_field_name)
     if resolver is None:
         resolver = get_batch_resolver(relationship_prop, single=True)
@@ -122,7 +135,8 @@ def _convert_o2o_or_m2o_relationship(
 def _convert_o2m_or_m2m_relationship(
     relationship_prop: RelationshipProperty,
     obj_type: Type["SQLAlchemyObjectType"],
-    connection_field_factory: Optional[Callable],
+    child_type: Type["SQLAlchemyObjectType"],
+    connection_field_factory: Callable,
     **field_kwargs,
 ) -> Field:
     """
@@ -130,17 +144,9 @@ def _convert_o2m_or_m2m_relationship(
     Return a list field or a connection field.
     """
 
-    child_type = obj_type._meta.registry.get_type_for_model(
-        relationship_prop.mapper.entity
-    )
-
     if not child_type._meta.connection:
         return Field(List(child_type), **field_kwargs)
 
-    # TODO Allow override of connection_field_factory and resolver via ORMField
-    if connection_field_factory is None:
-        connection_field_factory = BatchSQLAlchemyConnectionField.from_relationship
-
     return connection_field_factory(
         relationship_prop, obj_type._meta.registry, **field_kwargs
     )
@@ -192,11 +198,21 @@ def convert_sqlalchemy_column(
     column_prop: ColumnProperty, registry: Registry, resolver: Callable, **field_kwargs
 ):
     column = column_prop.columns[0]
-    field_kwargs.setdefault(
-        "type_",
-        convert_sqlalchemy_type(getattr(column, "type", None), column, registry),
-    )
-    field_kwargs.setdefault("required", not is_column_nullable(column))
-    field_kwargs.setdefault("description", get_column_doc(column))
-
-    return ModelField(resolver=resolver, model_field=column, **field_kwargs)
+    if "type_" in field_kwargs:
+        type_ = field_kwargs.pop("type_")
+    else:
+        type_ = convert_sqlalchemy_type(getattr(column, "type", None), column, registry)
+
+    if not field_kwargs:
+        # no ORMField overrides, the common case for generated fields
+        field_kwargs = {
+            "required": not is_column_nullable(column),
+            "description": get_column_doc(column),
+        }
+    else:
+        if "required" not in field_kwargs:
+            field_kwargs["required"] = not is_column_nullable(column)
+        if "description" not in field_kwargs:
+            field_kwargs["description"] = get_column_doc(column)
+
+    return ModelField(type_, resolver=resolver, model_field=column, **field_kwargs)
@@ -2,7 +2,7 @@ from collections import defaultdict
 from typing import TYPE_CHECKING, Type, Union
 
 import sqlalchemy as sa
-from graphene import Enum
+from graphene import Enum, Field
 from sqlalchemy import Column, Table
 from sqlalchemy.orm import DeclarativeMeta
 from sqlalchemy.types import Enum as SQLAlchemyEnumType
@@ -19,6 +19,7 @@ class Registry:
         self._registry_composites = {}
         self._registry_enums = {}
         self._registry_sort_enums = {}
+        self._registry_relationship_fields = {}
 
     def register(self, obj_type: Type["SQLAlchemyObjectType"]):
         from .types import SQLAlchemyObjectType
@@ -33,6 +34,8 @@ class Registry:
         #     f'another type "{self._registry[cls._meta.model]}".'
         # )
         self._registry[sa.inspect(obj_type._meta.model).local_table] = obj_type
+        # Relationship fields resolve their child type through this registry
+        self._registry_relationship_fields.clear()
 
     def get_type_for_model(self, model: Union[DeclarativeMeta, Table]):
         if isinstance(model, DeclarativeMeta):
@@ -60,6 +63,19 @@ class Registry:
     ):
         return self._registry_orm_fields.get(obj_type, {}).get(field_name)
 
+    def register_relationship_field(
+        self,
+        obj_type: Type["SQLAlchemyObjectType"],
+        field_name: str,
+        field: Field,
+    ):
+        self._registry_relationship_fields[(obj_type, field_name)] = field
+
+    def get_relationship_field(
+        self, obj_type: Type["SQLAlchemyObjectType"], field_name: str
+    ):
+        return self._registry_relationship_fields.get((obj_type, field_name))
+
     def register_composite_converter(self, composite, converter):
         self._registry_composites[composite] = converter
 
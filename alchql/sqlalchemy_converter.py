@@ -1,8 +1,11 @@
+import sys
+from collections.abc import Mapping
 from enum import EnumMeta
+from functools import lru_cache
+from typing import Callable, Dict, Type
 
 from graphene import Boolean, Enum, Float, ID, Int, List, String
 from graphene.types.json import JSONString
-from functools import singledispatch
 from sqlalchemy import types
 from sqlalchemy.dialects import postgresql
 
@@ -20,28 +23,75 @@ except ImportError:
     ChoiceType = JSONType = ScalarListType = TSVectorType = object
 
 
-@singledispatch
-def convert_sqlalchemy_type(type_, column, registry=None):
+def _convert_unknown_type(type_, column, registry=None):
     raise Exception(
         "Don't know how to convert the SQLAlchemy field %s (%s)"
         % (column, column.__class__)
     )
 
 
-@convert_sqlalchemy_type.register(types.Time)
-@convert_sqlalchemy_type.register(types.String)
-@convert_sqlalchemy_type.register(types.Text)
-@convert_sqlalchemy_type.register(types.Unicode)
-@convert_sqlalchemy_type.register(types.UnicodeText)
-@convert_sqlalchemy_type.register(postgresql.UUID)
-@convert_sqlalchemy_type.register(postgresql.INET)
-@convert_sqlalchemy_type.register(postgresql.CIDR)
-@convert_sqlalchemy_type.register(postgresql.TSVECTOR)
-@convert_sqlalchemy_type.register(TSVectorType)
+# Converters registered for an exact SQLAlchemy type class
+_CONVERTERS: Dict[type, Callable] = {object: _convert_unknown_type}
+# Converters resolved through the MRO, keyed by the concrete type class
+_dispatch_cache: Dict[type, Callable] = {}
+
+
+def _dispatch(cls: type) -> Callable:
+    try:
+        return _dispatch_cache[cls]
+    except KeyError:
+        pass
+
+    for base in cls.__mro__:
+        converter = _CONVERTERS.get(base)
+        if converter is not None:
+            break
+    else:
+        converter = _convert_unknown_type
+
+    _dispatch_cache[cls] = converter
+    return converter
+
+
+def convert_sqlalchemy_type(type_, column, registry=None):
+    return _dispatch(type(type_))(type_, column, registry)
+
+
+def _register_type_converter(cls: type, converter: Callable = None):
+    if converter is None:
+        return lambda fn: _register_type_converter(cls, fn)
+
+    _CONVERTERS[cls] = converter
+    _dispatch_cache.clear()
+    return converter
+
+
+convert_sqlalchemy_type.register = _register_type_converter
+convert_sqlalchemy_type.dispatch = _dispatch
+
+
+STRING_TYPES = (
+    types.Time,
+    types.String,
+    types.Text,
+    types.Unicode,
+    types.UnicodeText,
+    postgresql.UUID,
+    postgresql.INET,
+    postgresql.CIDR,
+    postgresql.TSVECTOR,
+    TSVectorType,
+)
+
+
 def convert_column_to_string(type_, column, registry=None):
     return String
 
 
+for _string_type in STRING_TYPES:
+    convert_sqlalchemy_type.register(_string_type, convert_column_to_string)
+
+
 @convert_sqlalchemy_type.register(types.Date)
 def convert_column_to_date(type_, column, registry=None):
     from graphene.types.datetime import Date
@@ -76,19 +126,52 @@ def convert_column_to_float(type_, column, registry=None):
 
 @convert_sqlalchemy_type.register(types.Enum)
 def convert_enum_to_enum(type_, column, registry=None):
-    return lambda: enum_for_sa_enum(type_, registry or get_global_registry())
+    enum = None
+
+    def get_enum():
+        # resolved lazily, a graphene enum may be registered after conversion
+        nonlocal enum
+        if enum is None:
+            enum = enum_for_sa_enum(type_, registry or get_global_registry())
+        return enum
+
+    return get_enum
+
+
+@lru_cache(maxsize=None)
+def _choice_enum_name(table_name: str, column_name: str) -> str:
+    return sys.intern(f"{table_name}_{column_name}".upper())
+
+
+# Graphene Enums built for ChoiceType columns, keyed by (name, choices)
+_choice_enum_cache: Dict[tuple, Type[Enum]] = {}
 
 
 # TODO Make ChoiceType conversion consistent with other enums
 @convert_sqlalchemy_type.register(ChoiceType)
 def convert_choice_to_enum(type_, column, registry=None):
-    name = f"{column.table.name}_{column.name}".upper()
+    name = _choice_enum_name(column.table.name, column.name)
     if isinstance(type_.choices, EnumMeta):
         # type.choices may be Enum/IntEnum, in ChoiceType both presented as EnumMeta
         # do not use from_enum here because we can have more than one enum column in table
-        return Enum(name, list((v.name, v.value) for v in type_.choices))
+        choices = list((v.name, v.value) for v in type_.choices)
     else:
-        return Enum(name, type_.choices)
+        choices = type_.choices
+
+    if isinstance(choices, Mapping):
+        key = (name, tuple(choices.items()))
+    else:
+        key = (name, tuple(choices))
+
+    try:
+        enum = _choice_enum_cache.get(key)
+    except TypeError:
+        # unhashable choice values, nothing to cache on
+        return Enum(name, choices)
+
+    if enum is None:
+        enum = _choice_enum_cache[key] = Enum(name, choices)
+    return enum
 
 
 @convert_sqlalchemy_type.register(ScalarListType)
@@ -99,7 +182,8 @@ def convert_scalar_list_to_list(type_, column, registry=None):
 @convert_sqlalchemy_type.register(types.ARRAY)
 @convert_sqlalchemy_type.register(postgresql.ARRAY)
 def convert_array_to_list(type_, column, registry=None):
-    inner_type = convert_sqlalchemy_type(column.type.item_type, column)
+    item_type = type_.item_type
+    inner_type = _dispatch(type(item_type))(item_type, column, registry)
     return List(inner_type)
 
 
@@ -19,7 +19,7 @@ requirements = [
     "SQLAlchemy>=1.4,<2",
     "aiodataloader == 0.2.1",
     "protobuf",
-    "setuptools>=v49.0.0",
+    "packaging",
 ]
 
 tests_require = [
@@ -30,6 +30,7 @@ tests_require = [
     "pytest-asyncio>=0.17.2,<0.18",
     "aiosqlite>=0.17.0,<0.18",
     "pytest-cov",
+    "orjson",
 ]
 
 setup(
@@ -55,6 +56,7 @@ setup(
     install_requires=requirements,
     extras_require={
         "test": tests_require,
+        "orjson": ["orjson"],
     },
     tests_require=tests_require,
 )
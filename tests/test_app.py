@@ -0,0 +1,326 @@
+import json
+from unittest.mock import patch
+
+import graphene
+import pytest
+import sqlalchemy as sa
+from graphene import Context
+from graphql import parse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+from starlette.background import BackgroundTasks
+from starlette.responses import JSONResponse
+
+from alchql.app import GraphQLResponse, SessionQLApp
+from alchql.extensions import Extension
+from alchql.types import SQLAlchemyObjectType
+from .models import Reporter
+
+
+def get_schema():
+    class ReporterType(SQLAlchemyObjectType):
+        class Meta:
+            model = Reporter
+            only_fields = ("id", "first_name")
+
+    class Query(graphene.ObjectType):
+        reporters = graphene.List(ReporterType)
+
+        async def resolve_reporters(self, info):
+            result = await info.context.session.execute(sa.select(Reporter))
+            return result.scalars().all()
+
+    return graphene.Schema(query=Query)
+
+
+async def post(app, body):
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/graphql",
+        "headers": [(b"content-type", b"application/json")],
+        "query_string": b"",
+    }
+    messages = [
+        {"type": "http.request", "body": json.dumps(body).encode()},
+    ]
+    sent = []
+
+    async def receive():
+        return messages.pop(0) if messages else {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+
+    await app(scope, receive, send)
+    return sent[0]["status"], json.loads(sent[1]["body"])
+
+
+async def count_reporters(engine):
+    async with engine.connect() as conn:
+        return await conn.scalar(sa.select(sa.func.count()).select_from(Reporter))
+
+
+class RecordingSession(AsyncSession):
+    instances = []
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.committed = False
+        self.closed = False
+        RecordingSession.instances.append(self)
+
+    async def commit(self):
+        self.committed = True
+        await super().commit()
+
+    async def close(self):
+        self.closed = True
+        await super().close()
+
+
+async def add_reporter_context(request, session):
+    session.add(Reporter(first_name="ABA"))
+    await session.flush()
+    return Context(request=request, session=session)
+
+
+class FailingExtension(Extension):
+    def request_finished(self, context):
+        raise RuntimeError("request failed")
+
+
+@pytest.fixture
+def recording_session_factory(engine):
+    RecordingSession.instances = []
+    return sessionmaker(engine, class_=RecordingSession)
+
+
+@pytest.mark.asyncio
+async def test_session_factory_commits_on_success(engine, recording_session_factory):
+    app = SessionQLApp(
+        engine=engine,
+        schema=get_schema(),
+        context_value=add_reporter_context,
+        session_factory=recording_session_factory,
+    )
+
+    status, body = await post(app, {"query": "{ reporters { firstName } }"})
+
+    assert status == 200
+    assert body == {"data": {"reporters": [{"firstName": "ABA"}]}}
+    (session,) = RecordingSession.instances
+    assert session.committed
+    assert session.closed
+    assert await count_reporters(engine) == 1
+
+
+@pytest.mark.asyncio
+async def test_session_factory_rolls_back_on_error(engine, recording_session_factory):
+    app = SessionQLApp(
+        engine=engine,
+        schema=get_schema(),
+        context_value=add_reporter_context,
+        extensions=[FailingExtension],
+        session_factory=recording_session_factory,
+    )
+
+    with pytest.raises(RuntimeError, match="request failed"):
+        await post(app, {"query": "{ reporters { firstName } }"})
+
+    (session,) = RecordingSession.instances
+    assert not session.committed
+    assert session.closed
+    assert await count_reporters(engine) == 0
+
+
+def test_positional_args_after_extensions_reach_graphql_app(engine):
+    schema = get_schema()
+
+    app = SessionQLApp(engine, Context, None, (), schema)
+
+    assert app.schema is schema
+    assert app.document_cache_size == 1024
+
+
+def test_response_render():
+    # orjson is part of the test extras
+    assert GraphQLResponse is not JSONResponse
+
+    response = GraphQLResponse({"data": {"name": "Ába", "count": 1}})
+
+    assert json.loads(response.body) == {"data": {"name": "Ába", "count": 1}}
+
+
+def test_response_render_big_int():
+    response = GraphQLResponse({"data": {"big": 2**70}})
+
+    assert response.body == b'{"data":{"big":1180591620717411303424}}'
+
+
+@pytest.mark.asyncio
+async def test_document_cache_hit_skips_parsing(engine):
+    app = SessionQLApp(engine=engine, schema=get_schema())
+    query = "{ reporters { firstName } }"
+
+    with patch("alchql.app.parse", wraps=parse) as parse_mock:
+        assert await post(app, {"query": query}) == (200, {"data": {"reporters": []}})
+        assert await post(app, {"query": query}) == (200, {"data": {"reporters": []}})
+
+    assert parse_mock.call_count == 1
+    assert list(app._document_cache) == [query]
+
+
+@pytest.mark.asyncio
+async def test_document_cache_evicts_least_recently_used(engine):
+    app = SessionQLApp(engine=engine, schema=get_schema(), document_cache_size=2)
+    first = "{ reporters { id } }"
+    second = "{ reporters { firstName } }"
+    third = "{ reporters { id firstName } }"
+
+    await post(app, {"query": first})
+    await post(app, {"query": second})
+    await post(app, {"query": first})
+    await post(app, {"query": third})
+
+    assert list(app._document_cache) == [first, third]
+
+
+@pytest.mark.asyncio
+async def test_document_cache_disabled(engine):
+    app = SessionQLApp(engine=engine, schema=get_schema(), document_cache_size=0)
+    query = "{ reporters { firstName } }"
+
+    with patch("alchql.app.parse", wraps=parse) as parse_mock:
+        await post(app, {"query": query})
+        await post(app, {"query": query})
+
+    assert parse_mock.call_count == 2
+    assert not app._document_cache
+
+
+@pytest.mark.asyncio
+async def test_syntax_error_is_not_cached(engine):
+    app = SessionQLApp(engine=engine, schema=get_schema())
+
+    status, body = await post(app, {"query": "{ reporters { "})
+
+    assert status == 200
+    assert body["data"] is None
+    assert body["errors"][0]["message"].startswith("Syntax Error")
+    assert not app._document_cache
+
+
+@pytest.mark.asyncio
+async def test_validation_error_is_not_cached(engine):
+    app = SessionQLApp(engine=engine, schema=get_schema())
+
+    status, body = await post(app, {"query": "{ spam }"})
+
+    assert status == 200
+    assert body == {
+        "data": None,
+        "errors": [
+            {
+                "message": "Cannot query field 'spam' on type 'Query'.",
+                "locations": [{"line": 1, "column": 3}],
+            }
+        ],
+    }
+    assert not app._document_cache
+
+
+@pytest.mark.asyncio
+async def test_multiple_operations_without_operation_name(engine):
+    app = SessionQLApp(engine=engine, schema=get_schema())
+    query = "query A { reporters { id } } query B { reporters { firstName } }"
+
+    status, body = await post(app, {"query": query})
+
+    assert status == 200
+    assert body["data"] is None
+    assert body["errors"][0]["message"] == (
+        "Must provide operation name if query contains multiple operations."
+    )
+
+    status, body = await post(app, {"query": query, "operationName": "B"})
+
+    assert status == 200
+    assert body == {"data": {"reporters": []}}
+
+
+@pytest.mark.asyncio
+async def test_context_factory_without_background(engine):
+    def context_value(request, session):
+        return Context(request=request, session=session)
+
+    app = SessionQLApp(engine=engine, schema=get_schema(), context_value=context_value)
+
+    assert not app._context_accepts_background
+    assert not app._context_is_async
+    assert await post(app, {"query": "{ reporters { id } }"}) == (
+        200,
+        {"data": {"reporters": []}},
+    )
+
+
+@pytest.mark.asyncio
+async def test_context_factory_with_kwargs(engine):
+    received = {}
+
+    def context_value(**kwargs):
+        received.update(kwargs)
+        return Context(**kwargs)
+
+    app = SessionQLApp(engine=engine, schema=get_schema(), context_value=context_value)
+
+    assert app._context_accepts_background
+    assert await post(app, {"query": "{ reporters { id } }"}) == (
+        200,
+        {"data": {"reporters": []}},
+    )
+    assert set(received) == {"request", "background", "session"}
+    assert isinstance(received["background"], BackgroundTasks)
+
+
+@pytest.mark.asyncio
+async def test_default_context(engine):
+    app = SessionQLApp(engine=engine, schema=get_schema())
+
+    assert app._context_accepts_background
+    assert not app._context_is_async
+    assert await post(app, {"query": "{ reporters { id } }"}) == (
+        200,
+        {"data": {"reporters": []}},
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_context_factory(engine):
+    app = SessionQLApp(
+        engine=engine, schema=get_schema(), context_value=add_reporter_context
+    )
+
+    assert app._context_is_async
+    assert not app._context_accepts_background
+    assert await post(app, {"query": "{ reporters { firstName } }"}) == (
+        200,
+        {"data": {"reporters": [{"firstName": "ABA"}]}},
+    )
+
+
+@pytest.mark.asyncio
+async def test_context_class_with_async_call(engine):
+    class AsyncCallContext(Context):
+        async def __call__(self):
+            raise AssertionError("should not be awaited")
+
+    app = SessionQLApp(
+        engine=engine, schema=get_schema(), context_value=AsyncCallContext
+    )
+
+    assert not app._context_is_async
+    assert await post(app, {"query": "{ reporters { id } }"}) == (
+        200,
+        {"data": {"reporters": []}},
+    )
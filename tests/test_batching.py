@@ -1,11 +1,16 @@
 import contextlib
+import gc
+import inspect
 import logging
+import weakref
 
 import graphene
 import pytest
 import sqlalchemy as sa
 from graphene import Context, relay
+from sqlalchemy.orm import declarative_base, relationship
 
+from alchql.batching import get_batch_resolver
 from alchql.middlewares import LoaderMiddleware
 from alchql.types import SQLAlchemyObjectType
 
@@ -825,3 +830,62 @@ async def test_many_to_many_sorted(session):
     assert not result.errors
     result = to_std_dicts(result.data)
     assert result == expected_result
+
+
+def test_batch_resolver_is_reused_per_relationship():
+    relationship_prop = Reporter.pets.property
+
+    resolver = get_batch_resolver(relationship_prop)
+    assert get_batch_resolver(relationship_prop) is resolver
+    assert get_batch_resolver(relationship_prop, single=True) is not resolver
+
+
+def test_batch_resolver_does_not_keep_models_alive():
+    Base = declarative_base()
+
+    class Parent(Base):
+        __tablename__ = "parent"
+        id = sa.Column(sa.Integer, primary_key=True)
+        children = relationship("Child")
+
+    class Child(Base):
+        __tablename__ = "child"
+        id = sa.Column(sa.Integer, primary_key=True)
+        parent_id = sa.Column(sa.Integer, sa.ForeignKey("parent.id"))
+
+    get_batch_resolver(Parent.children.property)
+    parent_ref = weakref.ref(Parent)
+
+    del Base, Parent, Child
+    gc.collect()
+
+    assert parent_ref() is None
+
+
+def test_batch_resolver_with_shared_info_dict():
+    shared_info = {}
+    Base = declarative_base()
+
+    class Parent(Base):
+        __tablename__ = "parent"
+        id = sa.Column(sa.Integer, primary_key=True)
+        first = relationship("First", info=shared_info)
+        second = relationship("Second", info=shared_info)
+
+    class First(Base):
+        __tablename__ = "first"
+        id = sa.Column(sa.Integer, primary_key=True)
+        parent_id = sa.Column(sa.Integer, sa.ForeignKey("parent.id"))
+
+    class Second(Base):
+        __tablename__ = "second"
+        id = sa.Column(sa.Integer, primary_key=True)
+        parent_id = sa.Column(sa.Integer, sa.ForeignKey("parent.id"))
+
+    first_resolver = get_batch_resolver(Parent.first.property)
+    second_resolver = get_batch_resolver(Parent.second.property)
+
+    assert first_resolver is not second_resolver
+    closure_vars = inspect.getclosurevars(second_resolver).nonlocals
+    assert closure_vars["relationship_prop"] is Parent.second.property
+    assert shared_info == {}
@@ -3,29 +3,44 @@ import pytest
 import sqlalchemy as sa
 from graphene import Context
 
-from .models import Article, HairKind, Pet, Reporter
+from .models import Article, CompositeFullName, HairKind, Pet, Reporter
+from alchql.converter import convert_sqlalchemy_composite
 from alchql.fields import BatchSQLAlchemyConnectionField
 from alchql.middlewares import LoaderMiddleware
 from alchql.node import AsyncNode
+from alchql.registry import Registry
 from alchql.types import SQLAlchemyObjectType
 
+MIDDLEWARE = (LoaderMiddleware([Article, Reporter, Pet]),)
+
+
+@pytest.fixture(scope="module")
+def schema():
+    # Built once per module, so it can't rely on the per-test global registry
+    schema_registry = Registry()
+
+    @convert_sqlalchemy_composite.register(CompositeFullName, schema_registry)
+    def convert_composite_class(composite, registry):
+        return graphene.Field(graphene.Int)
 
-def get_schema():
     class ReporterType(SQLAlchemyObjectType):
         class Meta:
             model = Reporter
+            registry = schema_registry
             interfaces = (AsyncNode,)
             connection_field_factory = BatchSQLAlchemyConnectionField.from_relationship
 
     class ArticleType(SQLAlchemyObjectType):
         class Meta:
             model = Article
+            registry = schema_registry
             interfaces = (AsyncNode,)
             connection_field_factory = BatchSQLAlchemyConnectionField.from_relationship
 
     class PetType(SQLAlchemyObjectType):
         class Meta:
             model = Pet
+            registry = schema_registry
             interfaces = (AsyncNode,)
             connection_field_factory = BatchSQLAlchemyConnectionField.from_relationship
 
@@ -46,23 +61,27 @@ def get_schema():
     return graphene.Schema(query=Query)
 
 
-async def benchmark_query(session, benchmark, query):
-    schema = get_schema()
+def benchmark_query(event_loop, session, benchmark, schema, query):
+    results = []
 
-    @benchmark
     async def execute_query():
         result = await schema.execute_async(
             query,
             context_value=Context(session=session),
-            middleware=[
-                LoaderMiddleware([Article, Reporter, Pet]),
-            ],
+            middleware=MIDDLEWARE,
         )
         assert not result.errors
+        results.append(result.data)
+
+    benchmark(lambda: event_loop.run_until_complete(execute_query()))
+
+    # the shared middleware has to give the same answer on every round
+    assert results
+    assert all(data == results[0] for data in results)
+    return results[0]
 
 
-@pytest.mark.asyncio
-async def test_one_to_one(session, benchmark):
+def test_one_to_one(event_loop, session, benchmark, schema):
     reporter_1 = Reporter(
         first_name="Reporter_1",
     )
@@ -71,20 +90,24 @@ async def test_one_to_one(session, benchmark):
         first_name="Reporter_2",
     )
     session.add(reporter_2)
+    # Reporter has no articles relationship, link articles through the foreign key
+    event_loop.run_until_complete(session.flush())
 
     article_1 = Article(headline="Article_1")
-    article_1.reporter = reporter_1
+    article_1.reporter_id = reporter_1.id
     session.add(article_1)
 
     article_2 = Article(headline="Article_2")
-    article_2.reporter = reporter_2
+    article_2.reporter_id = reporter_2.id
     session.add(article_2)
 
-    await session.commit()
+    event_loop.run_until_complete(session.commit())
 
-    await benchmark_query(
+    data = benchmark_query(
+        event_loop,
         session,
         benchmark,
+        schema,
         """
       query {
         reporters {
@@ -97,9 +120,15 @@ async def test_one_to_one(session, benchmark):
     """,
     )
 
+    assert data == {
+        "reporters": [
+            {"firstName": "Reporter_1", "favoriteArticle": {"headline": "Article_1"}},
+            {"firstName": "Reporter_2", "favoriteArticle": {"headline": "Article_2"}},
+        ]
+    }
 
-@pytest.mark.asyncio
-async def test_many_to_one(session, benchmark):
+
+def test_many_to_one(event_loop, session, benchmark, schema):
     reporter_1 = Reporter(
         first_name="Reporter_1",
     )
@@ -108,20 +137,24 @@ async def test_many_to_one(session, benchmark):
         first_name="Reporter_2",
     )
     session.add(reporter_2)
+    # Reporter has no articles relationship, link articles through the foreign key
+    event_loop.run_until_complete(session.flush())
 
     article_1 = Article(headline="Article_1")
-    article_1.reporter = reporter_1
+    article_1.reporter_id = reporter_1.id
     session.add(article_1)
 
     article_2 = Article(headline="Article_2")
-    article_2.reporter = reporter_2
+    article_2.reporter_id = reporter_2.id
     session.add(article_2)
 
-    await session.commit()
+    event_loop.run_until_complete(session.commit())
 
-    await benchmark_query(
+    data = benchmark_query(
+        event_loop,
         session,
         benchmark,
+        schema,
         """
       query {
         articles {
@@ -134,9 +167,15 @@ async def test_many_to_one(session, benchmark):
     """,
     )
 
+    assert data == {
+        "articles": [
+            {"headline": "Article_1", "reporter": {"firstName": "Reporter_1"}},
+            {"headline": "Article_2", "reporter": {"firstName": "Reporter_2"}},
+        ]
+    }
+
 
-@pytest.mark.asyncio
-async def test_one_to_many(session, benchmark):
+def test_one_to_many(event_loop, session, benchmark, schema):
     reporter_1 = Reporter(
         first_name="Reporter_1",
     )
@@ -145,28 +184,32 @@ async def test_one_to_many(session, benchmark):
         first_name="Reporter_2",
     )
     session.add(reporter_2)
+    # Reporter has no articles relationship, link articles through the foreign key
+    event_loop.run_until_complete(session.flush())
 
     article_1 = Article(headline="Article_1")
-    article_1.reporter = reporter_1
+    article_1.reporter_id = reporter_1.id
     session.add(article_1)
 
     article_2 = Article(headline="Article_2")
-    article_2.reporter = reporter_1
+    article_2.reporter_id = reporter_1.id
     session.add(article_2)
 
     article_3 = Article(headline="Article_3")
-    article_3.reporter = reporter_2
+    article_3.reporter_id = reporter_2.id
     session.add(article_3)
 
     article_4 = Article(headline="Article_4")
-    article_4.reporter = reporter_2
+    article_4.reporter_id = reporter_2.id
     session.add(article_4)
 
-    await session.commit()
+    event_loop.run_until_complete(session.commit())
 
-    await benchmark_query(
+    data = benchmark_query(
+        event_loop,
         session,
         benchmark,
+        schema,
         """
       query {
         reporters {
@@ -183,9 +226,31 @@ async def test_one_to_many(session, benchmark):
     """,
     )
 
-
-@pytest.mark.asyncio
-async def test_many_to_many(session, benchmark):
+    assert data == {
+        "reporters": [
+            {
+                "firstName": "Reporter_1",
+                "articles": {
+                    "edges": [
+                        {"node": {"headline": "Article_1"}},
+                        {"node": {"headline": "Article_2"}},
+                    ]
+                },
+            },
+            {
+                "firstName": "Reporter_2",
+                "articles": {
+                    "edges": [
+                        {"node": {"headline": "Article_3"}},
+                        {"node": {"headline": "Article_4"}},
+                    ]
+                },
+            },
+        ]
+    }
+
+
+def test_many_to_many(event_loop, session, benchmark, schema):
     reporter_1 = Reporter(
         first_name="Reporter_1",
     )
@@ -213,11 +278,13 @@ async def test_many_to_many(session, benchmark):
     reporter_2.pets.append(pet_3)
     reporter_2.pets.append(pet_4)
 
-    await session.commit()
+    event_loop.run_until_complete(session.commit())
 
-    await benchmark_query(
+    data = benchmark_query(
+        event_loop,
         session,
         benchmark,
+        schema,
         """
       query {
         reporters {
@@ -233,3 +300,20 @@ async def test_many_to_many(session, benchmark):
       }
     """,
     )
+
+    assert data == {
+        "reporters": [
+            {
+                "firstName": "Reporter_1",
+                "pets": {
+                    "edges": [{"node": {"name": "Pet_1"}}, {"node": {"name": "Pet_2"}}]
+                },
+            },
+            {
+                "firstName": "Reporter_2",
+                "pets": {
+                    "edges": [{"node": {"name": "Pet_3"}}, {"node": {"name": "Pet_4"}}]
+                },
+            },
+        ]
+    }
@@ -1,4 +1,5 @@
 import enum
+from unittest.mock import patch
 
 import pytest
 from sqlalchemy import Column, func, select, types
@@ -22,11 +23,13 @@ from alchql.converter import (
     convert_sqlalchemy_composite,
     convert_sqlalchemy_relationship,
 )
+from alchql.enums import enum_for_sa_enum
 from alchql.fields import (
     UnsortedSQLAlchemyConnectionField,
     default_connection_field_factory,
 )
 from alchql.registry import Registry, get_global_registry
+from alchql.sqlalchemy_converter import convert_sqlalchemy_type
 from alchql.types import SQLAlchemyObjectType
 from .models import Article, CompositeFullName, Pet, Reporter
 
@@ -114,6 +117,20 @@ def test_should_enum_convert_enum():
     assert not hasattr(field_type, "two")
 
 
+def test_should_enum_convert_enum_once():
+    get_enum = convert_sqlalchemy_type(
+        types.Enum(enum.Enum("TwoNumbers", ("one", "two"))), None
+    )
+    with patch(
+        "alchql.sqlalchemy_converter.enum_for_sa_enum", wraps=enum_for_sa_enum
+    ) as enum_mock:
+        first = get_enum()
+        second = get_enum()
+
+    assert first is second
+    assert enum_mock.call_count == 1
+
+
 def test_should_not_enum_convert_enum_without_name():
     field = get_field(types.Enum("one", "two"))
     re_err = r"No type name specified for Enum\('one', 'two'\)"
@@ -186,6 +203,27 @@ def test_should_intenum_choice_convert_enum():
     assert graphene_type._meta.enum.__members__["two"].value == 2
 
 
+def test_should_choice_convert_same_enum_twice():
+    choices = [("es", "Spanish"), ("en", "English")]
+    first = get_field(ChoiceType(choices)).type
+    second = get_field(ChoiceType(list(choices))).type
+
+    assert first is second
+
+
+def test_should_choice_with_unhashable_values_convert_enum():
+    choices = [("es", ["Spanish"]), ("en", ["English"])]
+    first = get_field(ChoiceType(choices)).type
+    second = get_field(ChoiceType(choices)).type
+
+    assert issubclass(first, graphene.Enum)
+    assert first._meta.name == "MODEL_COLUMN"
+    assert first._meta.enum.__members__["es"].value == ["Spanish"]
+    assert first._meta.enum.__members__["en"].value == ["English"]
+    # nothing to cache on, every conversion builds its own enum
+    assert first is not second
+
+
 def test_should_columproperty_convert():
     field = get_field_from_column(
         column_property(select([func.sum(func.cast(id, types.Integer))]).where(id == 1))
@@ -329,6 +367,28 @@ def test_should_onetoone_convert_field():
     assert graphene_type.type == A
 
 
+def test_should_relationship_dynamic_type_be_cached():
+    class A(SQLAlchemyObjectType):
+        class Meta:
+            model = Article
+
+    dynamic_field = convert_sqlalchemy_relationship(
+        Reporter.favorite_article.property,
+        A,
+        default_connection_field_factory,
+        "orm_field_name",
+    )
+    graphene_type = dynamic_field.get_type()
+    assert dynamic_field.get_type() is graphene_type
+
+    class B(SQLAlchemyObjectType):
+        class Meta:
+            model = Article
+
+    graphene_type = dynamic_field.get_type()
+    assert graphene_type.type == B
+
+
 def test_should_postgresql_uuid_convert():
     assert get_field(postgresql.UUID()).type == graphene.String
 